@@ -0,0 +1,117 @@
+"""
+Startup benchmark for the DataViz MCP server.
+
+Launches the server the way an MCP client does (one fresh process per session,
+JSON-RPC over stdio) and times how long it takes until the initialize and
+tools/list responses arrive. Run it before and after a change to track cold
+start:
+
+    python benchmark_startup.py --runs 5
+    python benchmark_startup.py --env DATAVIZ_PREWARM_IMPORTS=false
+    python benchmark_startup.py --command "docker run --rm -i saitejamothukuri/dataviz-mcp-server:latest"
+
+Prints one JSON object with per-run timings and their median; with
+--max-seconds the exit code is 1 when the median time to tools/list exceeds it.
+"""
+import argparse
+import json
+import os
+import queue
+import shlex
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+def read_lines(stream, lines: queue.Queue):
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def wait_for_response(lines: queue.Queue, request_id: int, deadline: float) -> dict:
+    """Return the JSON-RPC response with request_id, skipping notifications and log lines."""
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise TimeoutError(f"No response to request {request_id}")
+        line = lines.get(timeout=remaining)
+        if line is None:
+            raise RuntimeError("Server exited before responding")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if message.get("id") == request_id:
+            if "error" in message:
+                raise RuntimeError(f"Request {request_id} failed: {message['error']}")
+            return message
+
+
+def send(process, message: dict):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def measure_once(command: list, env: dict, timeout: float) -> dict:
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               text=True, bufsize=1, env=env)
+    lines = queue.Queue()
+    threading.Thread(target=read_lines, args=(process.stdout, lines), daemon=True).start()
+    deadline = start + timeout
+    try:
+        send(process, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "dataviz-startup-benchmark", "version": "1.0"},
+        }})
+        wait_for_response(lines, 1, deadline)
+        initialized = time.perf_counter() - start
+        send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = wait_for_response(lines, 2, deadline)["result"]["tools"]
+        listed = time.perf_counter() - start
+        return {"initialize_seconds": round(initialized, 3), "list_tools_seconds": round(listed, 3), "tools": len(tools)}
+    finally:
+        process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Measure DataViz MCP server time to first tools/list response.")
+    parser.add_argument("--runs", type=int, default=5, help="Server launches to time (default 5)")
+    parser.add_argument("--command", default="", help="Server command line (default: this Python running server.py)")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="Extra environment variable for the server")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds to wait for each launch")
+    parser.add_argument("--max-seconds", type=float, default=0, help="Fail when the median time to tools/list exceeds this")
+    args = parser.parse_args()
+
+    command = shlex.split(args.command) if args.command else [sys.executable, os.path.join(here, "server.py")]
+    env = dict(os.environ)
+    env.update(item.split("=", 1) for item in args.env)
+
+    runs = [measure_once(command, env, args.timeout) for _ in range(args.runs)]
+    report = {
+        "command": " ".join(command),
+        "env": args.env,
+        "runs": runs,
+        "median_initialize_seconds": round(statistics.median(r["initialize_seconds"] for r in runs), 3),
+        "median_list_tools_seconds": round(statistics.median(r["list_tools_seconds"] for r in runs), 3),
+    }
+    print(json.dumps(report, indent=2))
+    if args.max_seconds and report["median_list_tools_seconds"] > args.max_seconds:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
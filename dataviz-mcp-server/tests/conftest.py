@@ -0,0 +1,73 @@
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import types
+import uuid
+
+import pytest
+
+# server.py reads its configuration at import time, so point every directory at a scratch area first.
+SCRATCH = tempfile.mkdtemp(prefix="dataviz-tests-")
+os.environ.setdefault("DATAVIZ_DATA_ROOTS", os.path.join(SCRATCH, "data"))
+os.environ.setdefault("DATAVIZ_SPILL_DIR", os.path.join(SCRATCH, "spill"))
+os.environ.setdefault("DATAVIZ_PARSE_CACHE_DIR", os.path.join(SCRATCH, "parse-cache"))
+os.environ.setdefault("DATAVIZ_DOWNLOAD_DIR", os.path.join(SCRATCH, "downloads"))
+os.environ.setdefault("DATAVIZ_PREWARM_RENDERER", "false")
+os.makedirs(os.environ["DATAVIZ_DATA_ROOTS"], exist_ok=True)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server as dataviz_server  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    return dataviz_server
+
+
+@pytest.fixture
+def call():
+    """Invoke a tool's blocking implementation directly and return its raw string result."""
+    def invoke(tool, **kwargs):
+        return dataviz_server.tool_function(tool)(**kwargs)
+    return invoke
+
+
+@pytest.fixture
+def call_json(call):
+    """Invoke a tool that must succeed and return its parsed JSON response."""
+    def invoke(tool, **kwargs):
+        result = call(tool, **kwargs)
+        assert not result.startswith("Error"), result
+        return json.loads(result)
+    return invoke
+
+
+@pytest.fixture
+def data_dir():
+    return os.environ["DATAVIZ_DATA_ROOTS"]
+
+
+@pytest.fixture
+def mongo_url(monkeypatch):
+    """A MongoDB connection string served by mongomock in place of pymongo."""
+    mongomock = pytest.importorskip("mongomock")
+    pymongo = types.ModuleType("pymongo")
+    pymongo.MongoClient = mongomock.MongoClient
+    monkeypatch.setitem(sys.modules, "pymongo", pymongo)
+    url = f"mongodb://mock-{uuid.uuid4().hex[:8]}:27017"
+    yield url
+    dataviz_server.MONGO_CLIENTS.pop(url, None)
+
+
+@pytest.fixture
+def sqlite_url(request, tmp_path):
+    """A SQLite database with a sales(id, region, amount) table; parametrize indirectly with its row count (default 10)."""
+    rows = getattr(request, "param", 10)
+    path = tmp_path / "sales.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE sales (id INTEGER, region TEXT, amount REAL)")
+        conn.executemany("INSERT INTO sales VALUES (?, ?, ?)", [(i, "EU" if i % 2 else "US", i * 1.5) for i in range(rows)])
+    return f"sqlite:///{path}"
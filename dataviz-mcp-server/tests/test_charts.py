@@ -0,0 +1,145 @@
+import os
+
+import pandas as pd
+
+
+def saved_path(result: str) -> str:
+    return result.split("saved to ")[1].split(" ")[0]
+
+
+def test_histogram_bins_datetime_column_within_data_range(server):
+    series = pd.Series(pd.date_range("2024-01-01", "2024-12-31", freq="h")).astype("datetime64[us]")
+    labels, counts, numeric = server.histogram_counts(series, 12)
+    assert numeric
+    assert counts.sum() == len(series)
+    assert labels.min() >= series.min() and labels.max() <= series.max()
+
+
+def test_histogram_bins_tz_aware_datetime_column(server):
+    series = pd.Series(pd.date_range("2024-01-01", periods=1000, freq="min", tz="Europe/Berlin"))
+    labels, counts, _ = server.histogram_counts(series, 10)
+    assert str(labels.tz) == "Europe/Berlin"
+    assert labels.min() >= series.min() and labels.max() <= series.max()
+
+
+def test_create_histogram_labels_date_bins_inside_data(server, call, call_json, data_dir, tmp_path):
+    frame = pd.DataFrame({"day": pd.date_range("2023-03-01", periods=500, freq="D")})
+    path = os.path.join(data_dir, "days.csv")
+    frame.to_csv(path, index=False)
+    dataset_id = call_json(server.load_csv_file, file_path=path)["dataset_id"]
+    df = server.DATA_CACHE.get(dataset_id)
+    df["day"] = pd.to_datetime(df["day"])
+    server.DATA_CACHE.put(dataset_id, df)
+
+    output = str(tmp_path / "hist.json")
+    result = call(server.create_histogram, dataset_id=dataset_id, column="day", output_path=output, output_mode="json")
+    assert result.startswith("Histogram created"), result
+    figure = server.read_figure_json(saved_path(result))
+    bins = pd.to_datetime(pd.Series(server.trace_array(figure.data[0].x)))
+    assert bins.min() >= frame["day"].min() and bins.max() <= frame["day"].max()
+
+
+def load_frame(server, call_json, data_dir, name, frame, **kwargs):
+    path = os.path.join(data_dir, f"{name}.csv")
+    frame.to_csv(path, index=False)
+    return call_json(server.load_csv_file, file_path=path, **kwargs)["dataset_id"]
+
+
+def test_bar_and_pie_charts_accept_same_column_on_both_axes(server, call, call_json, data_dir, tmp_path):
+    dataset_id = load_frame(server, call_json, data_dir, "same_axis", pd.DataFrame({"c": list("aabbbc"), "n": [1, 2, 3, 4, 5, 6]}))
+    result = call(server.create_bar_chart, dataset_id=dataset_id, x_column="c", y_column="c", aggregation="count",
+                  output_path=str(tmp_path / "bar.json"), output_mode="json")
+    assert result.startswith("Bar chart created"), result
+    figure = server.read_figure_json(saved_path(result))
+    assert dict(zip(server.trace_array(figure.data[0].x), server.trace_array(figure.data[0].y))) == {"a": 2, "b": 3, "c": 1}
+
+    result = call(server.create_pie_chart, dataset_id=dataset_id, names_column="c", values_column="c", aggregation="count",
+                  output_path=str(tmp_path / "pie.html"))
+    assert result.startswith("Pie chart created"), result
+
+    frame = server.aggregate_for_chart(server.DATA_CACHE.get(dataset_id), "n", "n", "sum", 0)[0]
+    assert list(frame.columns) == ["n", "sum_n"]
+
+
+def test_lazy_bar_chart_accepts_same_column_on_both_axes(server, call, call_json, data_dir, tmp_path):
+    dataset_id = load_frame(server, call_json, data_dir, "same_axis_lazy", pd.DataFrame({"n": [1, 1, 2, 3, 3, 3]}), mode="lazy")
+    result = call(server.create_bar_chart, dataset_id=dataset_id, x_column="n", y_column="n", aggregation="sum",
+                  output_path=str(tmp_path / "lazy_bar.html"))
+    assert result.startswith("Bar chart created"), result
+
+
+def test_text_value_column_is_counted_instead_of_summed(server, call, call_json, data_dir, tmp_path):
+    frame = pd.DataFrame({"region": ["EU", "EU", "US"], "label": ["x", "y", "z"]})
+    ids = {}
+    for mode in ("eager", "lazy"):
+        dataset_id = ids[mode] = load_frame(server, call_json, data_dir, f"text_values_{mode}", frame, mode=mode)
+        result = call(server.create_bar_chart, dataset_id=dataset_id, x_column="region", y_column="label",
+                      output_path=str(tmp_path / f"text_bar_{mode}.json"), output_mode="json")
+        assert result.startswith("Bar chart created"), result
+        assert "sum needs a numeric value column, counted rows instead" in result
+        figure = server.read_figure_json(saved_path(result))
+        assert dict(zip(server.trace_array(figure.data[0].x), server.trace_array(figure.data[0].y))) == {"EU": 2, "US": 1}
+
+    result = call(server.create_pie_chart, dataset_id=ids["eager"], names_column="region",
+                  values_column="label", aggregation="mean", output_path=str(tmp_path / "text_pie.html"))
+    assert "mean needs a numeric value column" in result
+
+
+def test_numeric_text_values_are_still_summed(server):
+    df = pd.DataFrame({"k": ["a", "a", "b"], "v": ["1", "2", "n/a"]})
+    how, note = server.chart_aggregation("sum", df["v"])
+    assert (how, note) == ("sum", "")
+    frame = server.aggregate_for_chart(df, "k", "v", how, 0)[0]
+    assert frame.set_index("k")["v"].to_dict() == {"a": 3.0, "b": 0.0}
+
+
+def test_scatter_and_line_charts_accept_same_column_on_both_axes(server, call, call_json, data_dir, tmp_path):
+    frame = pd.DataFrame({"v": range(50), "g": ["a", "b"] * 25})
+    dataset_id = load_frame(server, call_json, data_dir, "same_axis_points", frame)
+    for max_points in ("", "10"):
+        for method in ("random", "grid"):
+            result = call(server.create_scatter_plot, dataset_id=dataset_id, x_column="v", y_column="v", color_column="v",
+                          max_points=max_points, downsample_method=method, output_path=str(tmp_path / "scatter.html"))
+            assert result.startswith("Scatter plot created"), result
+        result = call(server.create_line_chart, dataset_id=dataset_id, x_column="v", y_column="v",
+                      max_points=max_points, output_path=str(tmp_path / "line.html"))
+        assert result.startswith("Line chart created"), result
+
+
+def test_output_file_path_replaces_any_extension(server):
+    assert server.output_file_path("/out/chart.png", "png") == "/out/chart.png"
+    assert server.output_file_path("/out/chart.html", "svg") == "/out/chart.svg"
+    assert server.output_file_path("/out/chart.json.gz", "json.gz") == "/out/chart.json.gz"
+    assert server.output_file_path("/out/chart.png", "json") == "/out/chart.json"
+    assert server.output_file_path("/out/chart", "webp") == "/out/chart.webp"
+    assert server.output_file_path("/out/chart.html", "standalone") == "/out/chart.html"
+
+
+def test_png_output_path_is_written_once(server, call, call_json, data_dir, tmp_path):
+    dataset_id = load_frame(server, call_json, data_dir, "png_path", pd.DataFrame({"c": list("abc"), "n": [1, 2, 3]}))
+    result = call(server.create_bar_chart, dataset_id=dataset_id, x_column="c", y_column="n",
+                  output_path=str(tmp_path / "chart.png"), output_mode="png")
+    assert saved_path(result) == str(tmp_path / "chart.png")
+    assert os.path.exists(tmp_path / "chart.png")
+
+
+def test_line_chart_downsamples_text_series_by_position(server, call, call_json, data_dir, tmp_path):
+    frame = pd.DataFrame({"t": range(200), "state": ["on", "off", "idle", "on"] * 50})
+    dataset_id = load_frame(server, call_json, data_dir, "text_series", frame)
+    for method in ("lttb", "minmax"):
+        result = call(server.create_line_chart, dataset_id=dataset_id, x_column="t", y_column="state", max_points="20",
+                      downsample_method=method, output_path=str(tmp_path / f"state_{method}.json"), output_mode="json")
+        assert result.startswith("Line chart created"), result
+        assert "to 20 points with stride, y is not numeric" in result
+        figure = server.read_figure_json(saved_path(result))
+        x = server.trace_array(figure.data[0].x)
+        assert x[0] == 0 and x[-1] == 199
+
+
+def test_line_downsampling_keeps_datetime_extremes(server):
+    values = pd.Series(pd.date_range("2024-01-01", periods=1000, freq="h"))
+    values.iloc[500] = pd.Timestamp("2030-01-01")
+    df = pd.DataFrame({"i": range(1000), "when": values})
+    for method in ("lttb", "minmax"):
+        data, note = server.downsample_line(df, "i", "when", 50, method)
+        assert 500 in data["i"].tolist(), method
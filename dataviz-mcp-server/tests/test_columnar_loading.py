@@ -0,0 +1,41 @@
+import json
+import os
+
+import pandas as pd
+
+
+def write_partitioned(data_dir, name):
+    root = os.path.join(data_dir, name)
+    for year, region in [(2023, "EU"), (2023, "US"), (2024, "EU")]:
+        folder = os.path.join(root, f"year={year}", f"region={region}")
+        os.makedirs(folder, exist_ok=True)
+        pd.DataFrame({"amount": [1, 2]}).to_parquet(os.path.join(folder, "part-0.parquet"))
+    return root
+
+
+def load(server, call_json, **kwargs):
+    info = call_json(server.load_columnar_file, **kwargs)
+    return info, server.DATA_CACHE.get(info["dataset_id"])
+
+
+def test_directory_keeps_partition_columns(server, call_json, data_dir):
+    root = write_partitioned(data_dir, "sales_dir")
+    info, df = load(server, call_json, file_path=root)
+    assert {"amount", "year", "region"} <= set(df.columns)
+    assert len(df) == 6
+
+
+def test_glob_keeps_partition_columns(server, call_json, data_dir):
+    root = write_partitioned(data_dir, "sales_glob")
+    info, df = load(server, call_json, file_path=os.path.join(root, "**", "*.parquet"))
+    assert {"amount", "year", "region"} <= set(df.columns)
+    assert sorted(df["year"].astype(int).unique()) == [2023, 2024]
+
+
+def test_glob_inside_one_partition_keeps_its_value(server, call_json, data_dir):
+    root = write_partitioned(data_dir, "sales_one_year")
+    info, df = load(server, call_json, file_path=os.path.join(root, "year=2023", "*", "*.parquet"),
+                    filters=json.dumps([["region", "==", "EU"]]))
+    assert len(df) == 2
+    assert df["year"].astype(int).unique().tolist() == [2023]
+    assert df["region"].astype(str).unique().tolist() == ["EU"]
@@ -0,0 +1,87 @@
+import os
+
+import pandas as pd
+
+
+def load(server, call_json, path, **kwargs):
+    info = call_json(server.load_csv_file, file_path=path, **kwargs)
+    return info, server.DATA_CACHE.get(info["dataset_id"])
+
+
+def write(data_dir, name, frame):
+    path = os.path.join(data_dir, name)
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_default_optimization_keeps_integer_arithmetic_headroom(server, call_json, data_dir):
+    path = write(data_dir, "small_ints.csv", pd.DataFrame({"a": range(101), "f": [i / 4 for i in range(101)]}))
+    info, df = load(server, call_json, path)
+    assert str(df["a"].dtype) == "int32"
+    assert str(df["f"].dtype) == "float64"
+
+    filtered = call_json(server.filter_dataset, dataset_id=info["dataset_id"], expression="a * 2 > 150")
+    assert filtered["rows"] == 25
+
+
+def test_aggressive_optimization_is_opt_in(server, call_json, data_dir):
+    path = write(data_dir, "small_ints_aggressive.csv", pd.DataFrame({"a": range(101), "f": [i / 4 for i in range(101)]}))
+    _, df = load(server, call_json, path, optimize_dtypes="aggressive")
+    assert str(df["a"].dtype) == "int8"
+    assert str(df["f"].dtype) == "float32"
+    _, df = load(server, call_json, path, optimize_dtypes="false")
+    assert str(df["a"].dtype) == "int64"
+
+
+def test_large_integers_stay_int64(server, call_json, data_dir):
+    path = write(data_dir, "big_ints.csv", pd.DataFrame({"a": [0, 2 ** 40]}))
+    _, df = load(server, call_json, path)
+    assert str(df["a"].dtype) == "int64"
+
+
+def test_low_cardinality_strings_become_categories(server, call_json, data_dir):
+    path = write(data_dir, "labels.csv", pd.DataFrame({"c": ["x", "y"] * 50}))
+    info, df = load(server, call_json, path)
+    assert str(df["c"].dtype) == "category"
+    assert info["memory_saved_mb"] >= 0
+
+
+def test_lazy_summary_follows_file_changes(server, call_json, data_dir):
+    path = write(data_dir, "lazy_changes.csv", pd.DataFrame({"v": [1, 2, 3]}))
+    dataset_id = call_json(server.load_csv_file, file_path=path, mode="lazy")["dataset_id"]
+    first = call_json(server.generate_summary_report, dataset_id=dataset_id)
+    assert call_json(server.generate_summary_report, dataset_id=dataset_id) == first
+
+    pd.DataFrame({"v": [10, 20, 30, 40, 50], "w": ["a"] * 5}).to_csv(path, index=False)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000_000))
+    second = call_json(server.generate_summary_report, dataset_id=dataset_id)
+    assert first["total_rows"] == 3
+    assert second["total_rows"] == 5 and second["total_columns"] == 2
+    assert second["numeric_summary"]["v"]["max"] == 50
+
+
+def test_lazy_dataset_preview_shows_its_sample(server, call_json, data_dir):
+    path = write(data_dir, "lazy_preview.csv", pd.DataFrame({"a": range(20), "b": list("xy") * 10}))
+    info, _ = load(server, call_json, path, mode="lazy")
+    preview = call_json(server.preview_dataset, dataset_id=info["dataset_id"], num_rows="3", columns="b")
+    assert preview["state"] == "lazy"
+    assert preview["columns"] == ["b"]
+    assert preview["preview_rows"]["b"] == ["x", "y", "x"]
+
+
+def test_in_memory_tools_explain_lazy_datasets(server, call, call_json, data_dir, tmp_path):
+    path = write(data_dir, "lazy_charts.csv", pd.DataFrame({"a": range(20), "b": list("xy") * 10}))
+    info, _ = load(server, call_json, path, mode="lazy")
+    dataset_id = info["dataset_id"]
+    calls = {
+        "create_line_chart": dict(x_column="a", y_column="a"),
+        "create_pie_chart": dict(names_column="b", values_column="a"),
+        "create_scatter_plot": dict(x_column="a", y_column="a"),
+        "create_box_plot": dict(y_column="a"),
+        "create_dashboard": {},
+    }
+    for name, kwargs in calls.items():
+        result = call(getattr(server, name), dataset_id=dataset_id, output_path=str(tmp_path / f"{name}.html"), **kwargs)
+        assert result.startswith(f"Error: Dataset {dataset_id} is a lazy dataset, which {name} cannot read"), result
+        assert "filter_dataset or sample_dataset" in result
+    assert "list_loaded_datasets" in call(server.create_line_chart, dataset_id="missing", x_column="a", y_column="a")
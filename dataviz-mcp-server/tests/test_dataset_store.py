@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+
+def frame(n: int, seed: int = 0):
+    return pd.DataFrame({"a": range(seed, seed + n), "b": [float(i) for i in range(n)]})
+
+
+@pytest.fixture
+def store(server, tmp_path):
+    one = server.frame_nbytes(frame(1000))
+    return server.DatasetStore(int(one * 2.5), str(tmp_path / "spill"), True)
+
+
+def spill_files(store):
+    return os.listdir(store.spill_dir) if os.path.isdir(store.spill_dir) else []
+
+
+def test_evicted_dataset_spills_and_reloads(store):
+    store.put("a", frame(1000, 0))
+    store.put("b", frame(1000, 1))
+    store.put("c", frame(1000, 2))
+    assert store.describe("a")["state"] == "spilled"
+    assert len(spill_files(store)) == 1
+
+    reloaded = store.get("a")
+    pd.testing.assert_frame_equal(reloaded, frame(1000, 0))
+    assert store.describe("a")["state"] == "in_memory"
+    assert store.describe("b")["state"] == "spilled"
+    assert store.stats()["reloads"] == 1
+    assert len(spill_files(store)) == 1
+
+
+def test_pinned_dataset_is_never_evicted(store):
+    store.put("a", frame(1000), pinned=True)
+    store.put("b", frame(1000))
+    store.put("c", frame(1000))
+    assert store.describe("a")["state"] == "in_memory"
+    assert store.describe("b")["state"] == "spilled"
+
+
+def test_eviction_without_spilling_drops_the_dataset(server):
+    one = server.frame_nbytes(frame(1000))
+    store = server.DatasetStore(int(one * 1.5), "", False)
+    store.put("a", frame(1000))
+    store.put("b", frame(1000))
+    assert "a" not in store and store.get("b") is not None
+
+
+def test_unload_removes_spill_file(store):
+    for name in "abc":
+        store.put(name, frame(1000))
+    assert store.unload("a")
+    assert spill_files(store) == []
+    assert store.get("a") is None
+
+
+def test_spill_write_does_not_block_other_datasets(store, monkeypatch):
+    release = threading.Event()
+    writing = threading.Event()
+    real_write = store._write_spill
+
+    def slow_write(dataset_id, df):
+        if dataset_id == "a":
+            writing.set()
+            release.wait(10)
+        return real_write(dataset_id, df)
+
+    monkeypatch.setattr(store, "_write_spill", slow_write)
+    original = frame(1000, 0)
+    store.put("a", original)
+    store.put("b", frame(1000, 1))
+    writer = threading.Thread(target=store.put, args=("c", frame(1000, 2)))
+    writer.start()
+    assert writing.wait(5)
+
+    start = time.perf_counter()
+    assert store.get("b") is not None
+    assert sorted(store.keys()) == ["a", "b", "c"]
+    store.stats()
+    # The dataset being written out is still served from memory
+    assert store.get("a") is original
+    assert time.perf_counter() - start < 1
+
+    release.set()
+    writer.join(10)
+    assert store.describe("a")["state"] == "in_memory"
+    assert not any(name.startswith("a.") for name in spill_files(store))
+
+
+def test_replaced_dataset_discards_its_old_spill(store):
+    for name in "abc":
+        store.put(name, frame(1000))
+    store.put("a", frame(10, 5))
+    assert store.get("a")["a"].tolist()[0] == 5
+    assert not any(name.startswith("a.") for name in spill_files(store))
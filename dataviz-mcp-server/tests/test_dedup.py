@@ -0,0 +1,41 @@
+import os
+import time
+
+import pandas as pd
+
+
+def load(server, call_json, path):
+    return call_json(server.load_csv_file, file_path=path)
+
+
+def test_same_file_gets_same_id_until_it_changes(server, call_json, data_dir):
+    path = os.path.join(data_dir, "dedup.csv")
+    pd.DataFrame({"a": [1, 2]}).to_csv(path, index=False)
+    first = load(server, call_json, path)
+    second = load(server, call_json, path)
+    assert first["load_status"] == "loaded"
+    assert second["load_status"] == "cached"
+    assert second["dataset_id"] == first["dataset_id"]
+
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(path, index=False)
+    os.utime(path, (time.time() + 5, time.time() + 5))
+    changed = load(server, call_json, path)
+    assert changed["load_status"] == "reloaded_source_changed"
+    assert changed["replaced_dataset_id"] == first["dataset_id"]
+    assert changed["rows"] == 3
+    assert first["dataset_id"] not in server.DATA_CACHE
+
+
+def test_unloaded_dataset_is_served_from_parse_cache(server, call_json, data_dir):
+    path = os.path.join(data_dir, "dedup_disk.csv")
+    pd.DataFrame({"a": [1, 2]}).to_csv(path, index=False)
+    first = load(server, call_json, path)
+    server.DATA_CACHE.unload(first["dataset_id"])
+    again = load(server, call_json, path)
+    assert again["dataset_id"] == first["dataset_id"]
+    assert again["load_status"] == "disk_cache"
+
+
+def test_stable_id_is_deterministic(server):
+    assert server.stable_id("csv", "key", "v1") == server.stable_id("csv", "key", "v1")
+    assert server.stable_id("csv", "key", "v1") != server.stable_id("csv", "key", "v2")
@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def csv_path(data_dir):
+    def write(name, rows=100):
+        path = os.path.join(data_dir, name)
+        pd.DataFrame({"a": range(rows), "b": ["x", "y"] * (rows // 2)}).to_csv(path, index=False)
+        return path
+    return write
+
+
+@pytest.fixture
+def gate(server, monkeypatch):
+    """Hold jobs at chunk boundary number hold_at (default the first) until released, recording rows read at each boundary."""
+    gate = type("Gate", (), {})()
+    gate.hold_at = 1
+    gate.reached = threading.Event()
+    gate.release = threading.Event()
+    gate.rows = []
+    check_cancelled = server.LoadJob.check_cancelled
+
+    def check(job):
+        gate.rows.append(job.rows_done)
+        if len(gate.rows) >= gate.hold_at:
+            gate.reached.set()
+            gate.release.wait(10)
+        check_cancelled(job)
+
+    monkeypatch.setattr(server.LoadJob, "check_cancelled", check)
+    yield gate
+    gate.release.set()
+
+
+def wait_for(call_json, server, job_id, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = call_json(server.get_job_status, job_id=job_id)
+        if status["state"] in ("completed", "failed", "cancelled"):
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish: {status}")
+
+
+def test_completed_csv_job_matches_load_csv_file(server, call_json, csv_path, monkeypatch):
+    monkeypatch.setattr(server, "CHUNK_ROWS", 30)
+    path = csv_path("job_eager.csv")
+    job = call_json(server.start_load, source_type="csv", file_path=path)
+    status = wait_for(call_json, server, job["job_id"])
+    assert status["state"] == "completed"
+    assert status["progress_percent"] == 100.0
+    assert status["bytes_processed"] == status["bytes_total"] == os.path.getsize(path)
+    assert status["rows_processed"] == 100
+
+    info = call_json(server.load_csv_file, file_path=path)
+    assert info["dataset_id"] == status["dataset"]["dataset_id"]
+    assert info["load_status"] == "cached"
+    assert server.DATA_CACHE.get(info["dataset_id"]).dtypes.to_dict() == server.DATA_CACHE.get(status["dataset"]["dataset_id"]).dtypes.to_dict()
+
+
+def test_cancelling_a_queued_job_never_runs_it(server, call, call_json, csv_path, monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(server, "JOB_EXECUTOR", executor)
+    busy = threading.Event()
+    executor.submit(busy.wait, 10)
+    try:
+        job = call_json(server.start_load, source_type="csv", file_path=csv_path("job_queued.csv"))
+        assert job["state"] == "queued"
+        assert call(server.cancel_job, job_id=job["job_id"]) == f"Job {job['job_id']} cancellation requested"
+        status = call_json(server.get_job_status, job_id=job["job_id"])
+        assert status["state"] == "cancelled"
+        assert status["rows_processed"] == 0
+        assert call(server.cancel_job, job_id=job["job_id"]) == f"Job {job['job_id']} already cancelled"
+    finally:
+        busy.set()
+        executor.shutdown(wait=True)
+
+
+def test_cancelling_mid_stream_registers_nothing(server, call, call_json, csv_path, gate, monkeypatch):
+    monkeypatch.setattr(server, "CHUNK_ROWS", 10)
+    gate.hold_at = 2
+    path = csv_path("job_cancelled.csv")
+    job = call_json(server.start_load, source_type="csv", file_path=path)
+    assert gate.reached.wait(10)
+    assert call_json(server.get_job_status, job_id=job["job_id"])["state"] == "running"
+    call(server.cancel_job, job_id=job["job_id"])
+    gate.release.set()
+    status = wait_for(call_json, server, job["job_id"])
+    assert status["state"] == "cancelled"
+    assert "dataset" not in status
+    assert gate.rows == [0, 10]
+
+    optimize = server.optimize_level("true")
+    dataset_id = server.stable_id("csv", server.csv_source_key(path, ",", "utf-8", "", [], 0, 0, optimize),
+                                  server.file_fingerprint(path))
+    assert dataset_id not in server.DATA_CACHE
+    assert server.read_parse_cache(dataset_id) is None
+
+
+def test_sql_job_reports_progress_per_chunk(server, call_json, sqlite_url, gate):
+    gate.release.set()
+    job = call_json(server.start_load, source_type="sql", connection_string=sqlite_url, query="SELECT * FROM sales",
+                    chunksize="3", force_refresh="true")
+    status = wait_for(call_json, server, job["job_id"])
+    assert status["state"] == "completed"
+    assert gate.rows == [3, 6, 9, 10]
+    assert status["rows_processed"] == 10
+    assert status["dataset"]["rows"] == 10
+
+
+def test_sql_job_cancelled_between_chunks(server, call, call_json, sqlite_url, gate):
+    job = call_json(server.start_load, source_type="sql", connection_string=sqlite_url, query="SELECT id FROM sales",
+                    chunksize="4", force_refresh="true")
+    assert gate.reached.wait(10)
+    status = call_json(server.get_job_status, job_id=job["job_id"])
+    assert status["rows_processed"] == 4
+    call(server.cancel_job, job_id=job["job_id"])
+    gate.release.set()
+    assert wait_for(call_json, server, job["job_id"])["state"] == "cancelled"
+    assert gate.rows == [4]
+
+
+def test_failed_job_reports_its_error(server, call_json, sqlite_url):
+    job = call_json(server.start_load, source_type="sql", connection_string=sqlite_url, query="SELECT * FROM missing")
+    status = wait_for(call_json, server, job["job_id"])
+    assert status["state"] == "failed"
+    assert "missing" in status["error"]
+
+
+def test_job_listing_and_unknown_ids(server, call, call_json, csv_path):
+    job = call_json(server.start_load, source_type="csv", file_path=csv_path("job_listed.csv"))
+    wait_for(call_json, server, job["job_id"])
+    assert job["job_id"] in [entry["job_id"] for entry in call_json(server.get_job_status)["jobs"]]
+    assert call(server.get_job_status, job_id="job_missing") == "Error: Job job_missing not found"
+    assert call(server.cancel_job, job_id="job_missing") == "Error: Job job_missing not found"
+    assert call(server.start_load, source_type="ftp").startswith("Error: source_type must be one of")
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def orders(server, mongo_url):
+    server.get_mongo_client(mongo_url)["shop"]["orders"].insert_many([
+        {"n": i, "price": i * 10, "customer": {"name": f"c{i}", "city": "Oslo" if i % 2 else "Rome"}, "tags": ["a"]}
+        for i in range(6)
+    ])
+    return mongo_url
+
+
+def fetch(server, call_json, url, **kwargs):
+    info = call_json(server.connect_mongodb, connection_string=url, database="shop", collection="orders",
+                     force_refresh="true", **kwargs)
+    return info, server.DATA_CACHE.get(info["dataset_id"])
+
+
+def test_client_is_reused(server, call_json, orders):
+    client = server.get_mongo_client(orders)
+    fetch(server, call_json, orders)
+    fetch(server, call_json, orders, limit="2")
+    assert server.get_mongo_client(orders) is client
+
+
+def test_nested_documents_are_flattened(server, call_json, orders):
+    info, df = fetch(server, call_json, orders)
+    assert {"customer.name", "customer.city", "tags"} <= set(df.columns)
+    assert df["_id"].map(type).eq(str).all()
+    info, df = fetch(server, call_json, orders, flatten="false")
+    assert "customer" in df.columns and "customer.name" not in df.columns
+
+
+def test_projection_sort_and_limit(server, call_json, orders):
+    info, df = fetch(server, call_json, orders, query=json.dumps({"price": {"$gte": 10}}),
+                     projection=json.dumps({"n": 1}), sort=json.dumps({"n": -1}), limit="3", batch_size="2")
+    assert set(df.columns) == {"_id", "n"}
+    assert df["n"].tolist() == [5, 4, 3]
+
+
+def test_pipeline_runs_aggregation(server, call_json, orders):
+    stages = [{"$group": {"_id": "$customer.city", "total": {"$sum": "$price"}}}, {"$sort": {"_id": 1}}]
+    info, df = fetch(server, call_json, orders, pipeline=json.dumps(stages))
+    assert df.to_dict("list") == {"_id": ["Oslo", "Rome"], "total": [90, 60]}
+
+
+def test_pipeline_must_be_a_list(server, call, orders):
+    result = call(server.connect_mongodb, connection_string=orders, database="shop", collection="orders",
+                  pipeline=json.dumps({"$match": {}}))
+    assert result.startswith("Error: pipeline must be a JSON list")
+
+
+def test_documents_with_missing_fields_are_padded(server):
+    docs = [{"a": 1}, {"b": 2}, {"a": 3, "c": {"d": 4}}]
+    frame = server.documents_to_frame(iter(docs), flatten=True)
+    assert list(frame.columns) == ["a", "b", "c.d"]
+    assert frame.notna().to_dict("list") == {"a": [True, False, True], "b": [False, True, False], "c.d": [False, False, True]}
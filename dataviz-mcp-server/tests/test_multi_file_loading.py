@@ -0,0 +1,51 @@
+import json
+import os
+
+import pandas as pd
+
+
+def load_parts(server, call_json, data_dir, name, frames, **kwargs):
+    paths = []
+    for index, frame in enumerate(frames):
+        path = os.path.join(data_dir, f"{name}_{index}.parquet")
+        frame.to_parquet(path)
+        paths.append(path)
+    return call_json(server.load_multiple_files, file_paths=json.dumps(paths), optimize_dtypes="false", **kwargs)
+
+
+def test_mixed_bool_and_int_columns_become_int64(server, call_json, data_dir):
+    info = load_parts(server, call_json, data_dir, "flags", [pd.DataFrame({"flag": [True, False]}), pd.DataFrame({"flag": [5, 7]})])
+    df = server.DATA_CACHE.get(info["dataset_id"])
+    assert str(df["flag"].dtype) == "int64"
+    assert df["flag"].tolist() == [1, 0, 5, 7]
+    conflict = info["schema_report"]["type_conflicts"]["flag"]
+    assert conflict["dtypes"] == ["bool", "int64"]
+    assert conflict["resolved_as"] == "int64"
+
+
+def test_numeric_mixes_are_reported(server, call_json, data_dir):
+    info = load_parts(server, call_json, data_dir, "numbers", [pd.DataFrame({"v": [1, 2]}), pd.DataFrame({"v": [0.5, True]})], source_column="")
+    conflict = info["schema_report"]["type_conflicts"]["v"]
+    assert conflict["resolved_as"] == "float64"
+
+
+def test_text_conflicts_resolve_to_string(server, call_json, data_dir):
+    info = load_parts(server, call_json, data_dir, "labels", [pd.DataFrame({"v": [1, 2]}), pd.DataFrame({"v": ["a", "b"]})])
+    df = server.DATA_CACHE.get(info["dataset_id"])
+    assert df["v"].tolist() == ["1", "2", "a", "b"]
+    assert info["schema_report"]["type_conflicts"]["v"]["resolved_as"] == "string"
+
+
+def test_nested_ndjson_loads_with_default_optimization(server, call_json, data_dir):
+    paths = []
+    for index in range(2):
+        path = os.path.join(data_dir, f"events_{index}.jsonl")
+        with open(path, "w") as f:
+            for n in range(4):
+                f.write(json.dumps({"kind": "click", "tags": ["a", str(n)], "meta": {"n": n}}) + "\n")
+        paths.append(path)
+    info = call_json(server.load_multiple_files, file_paths=json.dumps(paths))
+    df = server.DATA_CACHE.get(info["dataset_id"])
+    assert len(df) == 8
+    assert df["tags"].iloc[0] == ["a", "0"]
+    assert str(df["kind"].dtype) == "category"
@@ -0,0 +1,167 @@
+import gzip
+import io
+import uuid
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(server, monkeypatch):
+    monkeypatch.setattr(server, "STORAGE_CLIENTS", {})
+
+
+def csv_bytes(frame, compress=False):
+    data = frame.to_csv(index=False).encode("utf-8")
+    return gzip.compress(data) if compress else data
+
+
+def parquet_bytes(frame):
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def s3():
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        bucket = f"bucket-{uuid.uuid4().hex[:8]}"
+        client.create_bucket(Bucket=bucket)
+        yield client, bucket
+
+
+def s3_params(bucket, key):
+    return dict(bucket_name=bucket, file_key=key, aws_access_key="test", aws_secret_key="test")
+
+
+def load_s3(server, call_json, bucket, key):
+    info = call_json(server.load_aws_s3_file, **s3_params(bucket, key))
+    return info, server.DATA_CACHE.get(info["dataset_id"])
+
+
+def test_s3_csv_is_streamed(server, call_json, s3):
+    client, bucket = s3
+    client.put_object(Bucket=bucket, Key="sales.csv", Body=csv_bytes(pd.DataFrame({"a": [1, 2, 3]})))
+    info, df = load_s3(server, call_json, bucket, "sales.csv")
+    assert info["load_status"] == "loaded"
+    assert df["a"].tolist() == [1, 2, 3]
+
+
+def test_s3_gzipped_csv_is_streamed(server, call_json, s3):
+    client, bucket = s3
+    client.put_object(Bucket=bucket, Key="rows.csv.gz", Body=csv_bytes(pd.DataFrame({"a": range(50)}), compress=True))
+    assert load_s3(server, call_json, bucket, "rows.csv.gz")[1]["a"].sum() == sum(range(50))
+
+
+def test_s3_binary_formats_use_ranged_download(server, call_json, s3, monkeypatch):
+    client, bucket = s3
+    client.put_object(Bucket=bucket, Key="big.parquet", Body=parquet_bytes(pd.DataFrame({"b": range(20)})))
+    downloads = []
+    original = server.parse_downloaded
+    monkeypatch.setattr(server, "parse_downloaded", lambda name, download: downloads.append(name) or original(name, download))
+    assert len(load_s3(server, call_json, bucket, "big.parquet")[1]) == 20
+    assert downloads == ["big.parquet"]
+
+
+def test_s3_prefix_concatenates_supported_objects(server, call_json, s3):
+    client, bucket = s3
+    for day in (1, 2, 3):
+        client.put_object(Bucket=bucket, Key=f"daily/2024-01-0{day}.csv", Body=csv_bytes(pd.DataFrame({"day": [day] * 2})))
+    client.put_object(Bucket=bucket, Key="daily/readme.txt", Body=b"ignored")
+    info, df = load_s3(server, call_json, bucket, "daily/")
+    assert df["day"].tolist() == [1, 1, 2, 2, 3, 3]
+
+
+def test_s3_unchanged_object_is_cached_and_changed_one_reloaded(server, call_json, s3):
+    client, bucket = s3
+    client.put_object(Bucket=bucket, Key="data.csv", Body=csv_bytes(pd.DataFrame({"a": [1]})))
+    first, _ = load_s3(server, call_json, bucket, "data.csv")
+    assert load_s3(server, call_json, bucket, "data.csv")[0]["load_status"] == "cached"
+    client.put_object(Bucket=bucket, Key="data.csv", Body=csv_bytes(pd.DataFrame({"a": [1, 2]})))
+    info, df = load_s3(server, call_json, bucket, "data.csv")
+    assert info["load_status"] == "reloaded_source_changed"
+    assert info["replaced_dataset_id"] == first["dataset_id"]
+    assert len(df) == 2
+
+
+def test_s3_unsupported_format(server, call, s3):
+    client, bucket = s3
+    assert call(server.load_aws_s3_file, **s3_params(bucket, "notes.txt")).startswith("Error: Unsupported file format")
+
+
+class FakeBlobClient:
+    def __init__(self, container, name):
+        self.container = container
+        self.name = name
+
+    def get_blob_properties(self):
+        return SimpleNamespace(etag=self.container.blobs[self.name][1])
+
+    def download_blob(self, max_concurrency=1):
+        self.container.downloads.append((self.name, max_concurrency))
+        data = self.container.blobs[self.name][0]
+        return SimpleNamespace(readinto=lambda stream: stream.write(data))
+
+
+class FakeContainerClient:
+    """Just enough of azure.storage.blob.ContainerClient for load_azure_blob."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.downloads = []
+
+    def upload(self, name, data):
+        self.blobs[name] = (data, uuid.uuid4().hex)
+
+    def list_blobs(self, name_starts_with=""):
+        return [SimpleNamespace(name=name, etag=etag) for name, (_, etag) in sorted(self.blobs.items())
+                if name.startswith(name_starts_with)]
+
+    def get_blob_client(self, name):
+        return FakeBlobClient(self, name)
+
+
+@pytest.fixture
+def azure(monkeypatch):
+    blob = pytest.importorskip("azure.storage.blob")
+    container = FakeContainerClient()
+    service = SimpleNamespace(get_container_client=lambda name: container)
+    monkeypatch.setattr(blob.BlobServiceClient, "from_connection_string", classmethod(lambda cls, conn: service))
+    return container
+
+
+def load_azure(server, call_json, blob_name, account="acct"):
+    info = call_json(server.load_azure_blob, account_name=account, container_name="exports", blob_name=blob_name, account_key="key")
+    return info, server.DATA_CACHE.get(info["dataset_id"])
+
+
+def test_azure_blob_is_downloaded_in_parallel(server, call_json, azure):
+    azure.upload("sales.parquet", parquet_bytes(pd.DataFrame({"a": [1, 2]})))
+    info, df = load_azure(server, call_json, "sales.parquet", account=uuid.uuid4().hex[:8])
+    assert df["a"].tolist() == [1, 2]
+    assert azure.downloads == [("sales.parquet", server.OBJECT_CONCURRENCY)]
+
+
+def test_azure_prefix_concatenates_supported_blobs(server, call_json, azure):
+    azure.upload("daily/1.csv", csv_bytes(pd.DataFrame({"day": [1]})))
+    azure.upload("daily/2.tsv", pd.DataFrame({"day": [2]}).to_csv(index=False, sep="\t").encode())
+    azure.upload("daily/notes.md", b"ignored")
+    info, df = load_azure(server, call_json, "daily/", account=uuid.uuid4().hex[:8])
+    assert df["day"].tolist() == [1, 2]
+
+
+def test_azure_unchanged_blob_is_cached_and_changed_one_reloaded(server, call_json, azure):
+    account = uuid.uuid4().hex[:8]
+    azure.upload("data.csv", csv_bytes(pd.DataFrame({"a": [1]})))
+    first, _ = load_azure(server, call_json, "data.csv", account)
+    assert load_azure(server, call_json, "data.csv", account)[0]["load_status"] == "cached"
+    assert len(azure.downloads) == 1
+    azure.upload("data.csv", csv_bytes(pd.DataFrame({"a": [1, 2]})))
+    info, df = load_azure(server, call_json, "data.csv", account)
+    assert info["load_status"] == "reloaded_source_changed"
+    assert info["replaced_dataset_id"] == first["dataset_id"]
+    assert len(df) == 2
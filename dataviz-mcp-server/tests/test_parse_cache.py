@@ -0,0 +1,60 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def cache_dir(server, tmp_path, monkeypatch):
+    path = tmp_path / "parse-cache"
+    path.mkdir()
+    monkeypatch.setattr(server, "PARSE_CACHE_DIR", str(path))
+    monkeypatch.setattr(server, "PARSE_CACHE", True)
+    return path
+
+
+def make_file(path, size: int, age: float):
+    path.write_bytes(b"x" * size)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+def test_prune_removes_least_recently_used_files_beyond_budget(server, cache_dir, monkeypatch):
+    monkeypatch.setattr(server, "PARSE_CACHE_MAX_MB", 2.5 / 1024)  # 2.5 KB
+    for name, age in (("old.feather", 300), ("mid.parquet", 200), ("new.feather", 100)):
+        make_file(cache_dir / name, 1024, age)
+    make_file(cache_dir / "notes.txt", 10_000, 500)
+
+    assert server.prune_parse_cache() == 1
+    assert sorted(os.listdir(cache_dir)) == ["mid.parquet", "new.feather", "notes.txt"]
+
+
+def test_prune_keeps_the_file_just_written(server, cache_dir, monkeypatch):
+    monkeypatch.setattr(server, "PARSE_CACHE_MAX_MB", 0.5 / 1024)
+    make_file(cache_dir / "a.feather", 1024, 300)
+    make_file(cache_dir / "b.feather", 1024, 100)
+    server.prune_parse_cache(keep=str(cache_dir / "a.feather"))
+    assert os.listdir(cache_dir) == ["a.feather"]
+
+
+def test_prune_drops_stale_partial_writes(server, cache_dir):
+    make_file(cache_dir / "crashed.feather.tmp", 10, 7200)
+    make_file(cache_dir / "writing.feather.tmp", 10, 1)
+    server.prune_parse_cache()
+    assert os.listdir(cache_dir) == ["writing.feather.tmp"]
+
+
+def test_reads_refresh_recency_and_writes_enforce_budget(server, cache_dir, monkeypatch):
+    frame = pd.DataFrame({"a": range(2000)})
+    server.write_parse_cache("first", frame)
+    one = os.path.getsize(cache_dir / "first.feather")
+    monkeypatch.setattr(server, "PARSE_CACHE_MAX_MB", one * 2.5 / 1024 / 1024)
+    stamp = time.time() - 100
+    os.utime(cache_dir / "first.feather", (stamp, stamp))
+    server.write_parse_cache("second", frame)
+    os.utime(cache_dir / "second.feather", (stamp + 10, stamp + 10))
+
+    assert server.read_parse_cache("first") is not None  # now the most recently used
+    server.write_parse_cache("third", frame)
+    assert sorted(os.listdir(cache_dir)) == ["first.feather", "third.feather"]
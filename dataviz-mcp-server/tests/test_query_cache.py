@@ -0,0 +1,66 @@
+import sqlite3
+
+import pytest
+
+
+def sql(server, call_json, url, query="SELECT * FROM sales", **kwargs):
+    return call_json(server.connect_sql_database, connection_string=url, query=query, **kwargs)
+
+
+def insert_row(url):
+    with sqlite3.connect(url[len("sqlite:///"):]) as conn:
+        conn.execute("INSERT INTO sales VALUES (99, 'EU', 1.0)")
+
+
+@pytest.mark.parametrize("sqlite_url", [6], indirect=True)
+def test_repeated_query_is_served_from_cache(server, call_json, sqlite_url):
+    first = sql(server, call_json, sqlite_url)
+    insert_row(sqlite_url)
+    second = sql(server, call_json, sqlite_url, query="SELECT *\n  FROM sales;")
+    assert first["load_status"] == "loaded"
+    assert second["load_status"] == "cached"
+    assert second["dataset_id"] == first["dataset_id"]
+    assert second["rows"] == 6
+
+
+@pytest.mark.parametrize("sqlite_url", [6], indirect=True)
+def test_force_refresh_refetches(server, call_json, sqlite_url):
+    first = sql(server, call_json, sqlite_url)
+    insert_row(sqlite_url)
+    refreshed = sql(server, call_json, sqlite_url, force_refresh="yes")
+    assert refreshed["load_status"] == "refreshed"
+    assert refreshed["dataset_id"] == first["dataset_id"]
+    assert refreshed["rows"] == 7
+
+
+def test_expired_result_is_refetched(server, call_json, sqlite_url, monkeypatch):
+    sql(server, call_json, sqlite_url)
+    monkeypatch.setattr(server, "SQL_CACHE_TTL", 1e-9)
+    assert sql(server, call_json, sqlite_url)["load_status"] == "refreshed"
+
+
+def test_oversized_results_are_not_cached(server, call_json, sqlite_url, monkeypatch):
+    monkeypatch.setattr(server.QUERY_CACHE, "max_result_bytes", 0)
+    sql(server, call_json, sqlite_url)
+    assert sql(server, call_json, sqlite_url)["load_status"] == "refreshed"
+
+
+def test_mongo_results_are_cached(server, call_json, mongo_url):
+    server.get_mongo_client(mongo_url)["shop"]["orders"].insert_many([{"n": i} for i in range(4)])
+    kwargs = dict(connection_string=mongo_url, database="shop", collection="orders")
+    first = call_json(server.connect_mongodb, **kwargs)
+    server.get_mongo_client(mongo_url)["shop"]["orders"].insert_one({"n": 4})
+    second = call_json(server.connect_mongodb, **kwargs)
+    refreshed = call_json(server.connect_mongodb, force_refresh="true", **kwargs)
+    assert (first["load_status"], second["load_status"], refreshed["load_status"]) == ("loaded", "cached", "refreshed")
+    assert (second["rows"], refreshed["rows"]) == (4, 5)
+
+
+def test_cache_evicts_oldest_entries():
+    from server import QueryResultCache
+    cache = QueryResultCache(max_entries=2, max_result_bytes=1024)
+    for name in ("a", "b", "c"):
+        cache.record(name, 10)
+    assert cache.age("a", 60) is None
+    assert cache.age("c", 60) is not None
+    assert cache.stats() == {"entries": 2, "hits": 1, "misses": 1}
@@ -0,0 +1,54 @@
+import pytest
+
+
+def connect(server, call_json, url, query="SELECT * FROM sales", **kwargs):
+    return call_json(server.connect_sql_database, connection_string=url, query=query, **kwargs)
+
+
+@pytest.mark.parametrize("chunksize", ["3", "5", "100"])
+def test_result_of_exactly_max_rows_is_not_truncated(server, call_json, sqlite_url, chunksize):
+    info = connect(server, call_json, sqlite_url, chunksize=chunksize, max_rows="10", force_refresh="true")
+    assert info["rows"] == 10
+    assert info["truncated"] is False
+
+
+@pytest.mark.parametrize("chunksize", ["3", "5", "100"])
+def test_result_beyond_max_rows_is_truncated(server, call_json, sqlite_url, chunksize):
+    info = connect(server, call_json, sqlite_url, chunksize=chunksize, max_rows="5", force_refresh="true")
+    assert info["rows"] == 5
+    assert info["truncated"] is True
+
+
+def test_engine_is_pooled_across_calls(server, call_json, sqlite_url):
+    connect(server, call_json, sqlite_url, force_refresh="true")
+    engine = server.SQL_ENGINES[sqlite_url]["engine"]
+    connect(server, call_json, sqlite_url, query="SELECT id FROM sales", force_refresh="true")
+    assert server.SQL_ENGINES[sqlite_url]["engine"] is engine
+
+
+def test_idle_engines_are_disposed(server, sqlite_url, monkeypatch):
+    server.get_sql_engine(sqlite_url)
+    monkeypatch.setattr(server, "SQL_ENGINE_IDLE_SECONDS", 0)
+    with server.SQL_ENGINES_LOCK:
+        server.dispose_idle_engines(server.time.time() + 1)
+    assert sqlite_url not in server.SQL_ENGINES
+
+
+def test_results_are_fetched_in_chunks(server, call_json, sqlite_url):
+    info = connect(server, call_json, sqlite_url, chunksize="4", max_rows="0", force_refresh="true")
+    assert info["rows"] == 10
+    assert info["chunks_fetched"] == 3
+    df = server.DATA_CACHE.get(info["dataset_id"])
+    assert df["id"].tolist() == list(range(10))
+
+
+@pytest.mark.parametrize("sqlite_url", [0], indirect=True)
+def test_empty_result_keeps_columns(server, call_json, sqlite_url):
+    info = connect(server, call_json, sqlite_url)
+    assert info["rows"] == 0
+    assert info["columns"] == ["id", "region", "amount"]
+
+
+def test_query_error_is_reported(server, call, sqlite_url):
+    result = call(server.connect_sql_database, connection_string=sqlite_url, query="SELECT * FROM missing")
+    assert result.startswith("Error connecting to SQL database")
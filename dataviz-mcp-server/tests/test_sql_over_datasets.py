@@ -0,0 +1,61 @@
+import pandas as pd
+
+
+def register(server, name, frame):
+    dataset_id = f"test_{name}"
+    server.DATA_CACHE.put(dataset_id, frame)
+    return dataset_id
+
+
+def test_sql_aggregates_come_back_numeric(server, call_json):
+    dataset_id = register(server, "sums", pd.DataFrame({"g": ["a", "b", "a"], "x": [1, 2, 3], "p": [1.5, 2.5, 3.5]}))
+    query = f"SELECT g, SUM(x) AS total, CAST(SUM(p) AS DECIMAL(10, 2)) AS price, SUM(x) * 1e30::HUGEINT AS big FROM {dataset_id} GROUP BY g ORDER BY g"
+    info = call_json(server.sql_over_datasets, query=query)
+    df = server.DATA_CACHE.get(info["dataset_id"])
+    assert str(df["total"].dtype) == "int64"
+    assert df["total"].tolist() == [4, 2]
+    assert str(df["price"].dtype) == "float64"
+    assert str(df["big"].dtype) == "float64"
+    assert pd.api.types.is_numeric_dtype(df["big"])
+
+
+def test_sql_result_feeds_numeric_chart_tools(server, call, call_json, tmp_path):
+    dataset_id = register(server, "heat", pd.DataFrame({"g": ["a", "b", "a", "b"], "x": [1, 2, 3, 4], "y": [5, 6, 7, 8]}))
+    info = call_json(server.sql_over_datasets, query=f"SELECT g, SUM(x) AS sx, SUM(y) AS sy FROM {dataset_id} GROUP BY g")
+    result = call(server.create_heatmap, dataset_id=info["dataset_id"], output_path=str(tmp_path / "heat.html"))
+    assert not result.startswith("Error"), result
+
+
+def test_sql_force_refresh_accepts_shared_flag_spellings(server, call_json):
+    dataset_id = register(server, "refresh", pd.DataFrame({"x": [1, 2, 3]}))
+    query = f"SELECT COUNT(*) AS n FROM {dataset_id}"
+    assert call_json(server.sql_over_datasets, query=query)["load_status"] in ("loaded", "cached")
+    assert call_json(server.sql_over_datasets, query=query)["load_status"] == "cached"
+    for flag in ("1", "yes", "TRUE"):
+        assert call_json(server.sql_over_datasets, query=query, force_refresh=flag)["load_status"] != "cached"
+
+
+def test_sql_only_globs_literals_in_table_positions(server, call_json, monkeypatch):
+    dataset_id = register(server, "names", pd.DataFrame({"name": ["Ann", "bob"]}))
+    walked = []
+    real_glob = server.glob.glob
+    monkeypatch.setattr(server.glob, "glob", lambda pattern, **kw: walked.append(pattern) or real_glob(pattern, **kw))
+    query = f"SELECT name, '/**' AS marker FROM {dataset_id} WHERE name LIKE '[A-Z]%' OR name = '*?'"
+    info = call_json(server.sql_over_datasets, query=query)
+    assert info["derived_from"]["parameters"]["files"] == []
+    assert walked == []
+
+
+def test_sql_file_references_resolve_against_data_roots(server, call_json, data_dir):
+    pd.DataFrame({"v": [1, 2, 3]}).to_parquet(f"{data_dir}/refs.parquet")
+    info = call_json(server.sql_over_datasets, query=f"SELECT SUM(v) AS s FROM '{data_dir}/refs.parquet'")
+    assert info["derived_from"]["parameters"]["files"] == [f"{data_dir}/refs.parquet"]
+    assert server.DATA_CACHE.get(info["dataset_id"])["s"].tolist() == [6]
+
+
+def test_restricted_globs_never_walk_outside_data_roots(server, monkeypatch):
+    monkeypatch.setattr(server, "RESTRICT_TO_ROOTS", True)
+    walked = []
+    monkeypatch.setattr(server.glob, "glob", lambda pattern, **kw: walked.append(pattern) or [])
+    assert server.query_file_references("SELECT * FROM read_parquet('/**/*.parquet')") == []
+    assert walked == []
@@ -0,0 +1,132 @@
+import os
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def sales(server):
+    frame = pd.DataFrame({
+        "region": ["EU", "EU", "US", "US", "US", "APAC"] * 10,
+        "amount": [10.0, 20.0, 5.0, 15.0, 25.0, 40.0] * 10,
+        "units": [1, 2, 1, 3, 5, 4] * 10,
+    })
+    server.DATA_CACHE.put("test_sales", frame)
+    yield "test_sales"
+    server.DATA_CACHE.unload("test_sales")
+
+
+@pytest.fixture
+def lazy_sales(server, call_json, data_dir, monkeypatch):
+    monkeypatch.setattr(server, "CHUNK_ROWS", 7)
+    path = os.path.join(data_dir, "lazy_sales.csv")
+    pd.DataFrame({"region": ["EU", "US", "APAC", "US"] * 25, "amount": range(100)}).to_csv(path, index=False)
+    return call_json(server.load_csv_file, file_path=path, mode="lazy")["dataset_id"]
+
+
+def frame_of(server, info):
+    return server.DATA_CACHE.get(info["dataset_id"])
+
+
+def test_count_rows_per_group(server, call_json, sales):
+    info = call_json(server.aggregate_dataset, dataset_id=sales, group_by="region", aggregations="*:count")
+    assert frame_of(server, info).to_dict("list") == {"region": ["APAC", "EU", "US"], "count": [10, 20, 30]}
+
+
+def test_count_rows_with_named_aggregations(server, call_json, sales):
+    info = call_json(server.aggregate_dataset, dataset_id=sales, group_by="region",
+                     aggregations="amount:sum,units:max,*:count")
+    df = frame_of(server, info).set_index("region")
+    assert list(df.columns) == ["amount_sum", "units_max", "count"]
+    assert df.loc["US"].to_dict() == {"amount_sum": 450.0, "units_max": 5, "count": 30}
+    assert info["derived_from"] == {"operation": "aggregate", "parents": [sales],
+                                    "parameters": {"group_by": ["region"], "aggregations": ["amount:sum", "units:max", "*:count"]}}
+
+
+def test_whole_frame_aggregation_without_group_by(server, call_json, sales):
+    info = call_json(server.aggregate_dataset, dataset_id=sales, aggregations="amount:mean,region:nunique,*:count")
+    assert frame_of(server, info).to_dict("records") == [{"amount_mean": 19.166666666666668, "region_nunique": 3, "count": 60}]
+
+
+def test_invalid_aggregations_are_rejected(server, call, sales):
+    assert call(server.aggregate_dataset, dataset_id=sales, aggregations="*:sum") == "Error: '*' only supports count"
+    assert call(server.aggregate_dataset, dataset_id=sales, aggregations="amount:mode").startswith("Error: Invalid aggregation 'amount:mode'")
+    assert call(server.aggregate_dataset, dataset_id=sales, group_by="city", aggregations="*:count") == "Error: Columns not found: city"
+
+
+def test_stratified_sample_by_n(server, call_json, sales):
+    info = call_json(server.sample_dataset, dataset_id=sales, n="4", method="stratified", stratify_column="region")
+    assert frame_of(server, info)["region"].value_counts().to_dict() == {"APAC": 4, "EU": 4, "US": 4}
+
+
+def test_stratified_sample_by_n_keeps_small_groups_whole(server, call_json, sales):
+    info = call_json(server.sample_dataset, dataset_id=sales, n="15", method="stratified", stratify_column="region")
+    assert frame_of(server, info)["region"].value_counts().to_dict() == {"US": 15, "EU": 15, "APAC": 10}
+
+
+def test_stratified_sample_by_fraction(server, call_json, sales):
+    info = call_json(server.sample_dataset, dataset_id=sales, fraction="0.5", method="stratified", stratify_column="region")
+    assert frame_of(server, info)["region"].value_counts().to_dict() == {"US": 15, "EU": 10, "APAC": 5}
+
+
+def test_sample_is_reproducible_and_validated(server, call, call_json, sales):
+    first = call_json(server.sample_dataset, dataset_id=sales, n="5", seed="7")
+    assert frame_of(server, first).index.tolist() == frame_of(server, call_json(server.sample_dataset, dataset_id=sales, n="5", seed="7")).index.tolist()
+    assert call(server.sample_dataset, dataset_id=sales, n="5", fraction="0.5") == "Error: Provide exactly one of n or fraction"
+    assert call(server.sample_dataset, dataset_id=sales, n="5", method="stratified") == "Error: stratified sampling needs a valid stratify_column"
+
+
+def test_filter_lazy_dataset_chunk_by_chunk(server, call_json, lazy_sales):
+    info = call_json(server.filter_dataset, dataset_id=lazy_sales, expression="region == 'US'", columns="amount")
+    df = frame_of(server, info)
+    assert list(df.columns) == ["amount"]
+    assert df["amount"].tolist() == [a for a in range(100) if a % 4 in (1, 3)]
+
+
+def test_sample_lazy_dataset(server, call, call_json, lazy_sales):
+    head = frame_of(server, call_json(server.sample_dataset, dataset_id=lazy_sales, n="10", method="head"))
+    assert head["amount"].tolist() == list(range(10))
+    sampled = frame_of(server, call_json(server.sample_dataset, dataset_id=lazy_sales, fraction="0.5"))
+    assert 0 < len(sampled) < 100
+    assert set(sampled["amount"]) <= set(range(100))
+    assert call(server.sample_dataset, dataset_id=lazy_sales, n="10").startswith("Error: Lazy datasets support head sampling")
+
+
+def test_duckdb_filter_engine_matches_pandas(server, call, call_json, sales):
+    duck = call_json(server.filter_dataset, dataset_id=sales, expression="region = 'US' AND amount > 10",
+                     columns="region,amount", engine="duckdb")
+    pandas = call_json(server.filter_dataset, dataset_id=sales, expression="region == 'US' and amount > 10",
+                       columns="region,amount")
+    assert duck["dataset_id"] != pandas["dataset_id"]
+    assert frame_of(server, duck).to_dict("list") == frame_of(server, pandas).reset_index(drop=True).to_dict("list")
+    assert call(server.filter_dataset, dataset_id=sales, expression="x", engine="spark") == "Error: engine must be pandas or duckdb"
+
+
+def test_join_datasets(server, call_json, sales):
+    server.DATA_CACHE.put("test_regions", pd.DataFrame({"code": ["EU", "US"], "amount": [1, 2]}))
+    info = call_json(server.join_datasets, left_dataset_id=sales, right_dataset_id="test_regions",
+                     left_on="region", right_on="code", how="left")
+    df = frame_of(server, info)
+    assert len(df) == 60
+    assert {"amount_left", "amount_right"} <= set(df.columns)
+    assert df["code"].isna().sum() == 10
+
+
+def test_repeated_transformation_is_cached_until_parent_is_replaced(server, call_json, sales):
+    params = dict(dataset_id=sales, group_by="region", aggregations="amount:sum")
+    first = call_json(server.aggregate_dataset, **params)
+    again = call_json(server.aggregate_dataset, **params)
+    assert first["load_status"] == "loaded"
+    assert again["load_status"] == "cached"
+    assert again["dataset_id"] == first["dataset_id"]
+
+    server.DATA_CACHE.put(sales, pd.DataFrame({"region": ["EU"], "amount": [1.0], "units": [1]}))
+    changed = call_json(server.aggregate_dataset, **params)
+    assert changed["load_status"] == "reloaded_source_changed"
+    assert changed["replaced_dataset_id"] == first["dataset_id"]
+    assert first["dataset_id"] not in server.DATA_CACHE
+    assert frame_of(server, changed).to_dict("list") == {"region": ["EU"], "amount_sum": [1.0]}
+
+    refreshed = call_json(server.aggregate_dataset, **params)
+    assert refreshed["load_status"] == "cached"
+    assert refreshed["dataset_id"] == changed["dataset_id"]